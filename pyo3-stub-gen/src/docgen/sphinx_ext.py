@@ -3,9 +3,14 @@
 
 import json
 import re
+import textwrap
+import threading
+from bisect import bisect_left
+from collections import defaultdict
 from functools import lru_cache
 from pathlib import Path
 from docutils import nodes
+from docutils.core import publish_doctree
 from sphinx.addnodes import (
     desc, desc_signature, desc_name, desc_parameterlist,
     desc_parameter, desc_returns, pending_xref, desc_content, desc_annotation,
@@ -14,135 +19,169 @@ from sphinx.addnodes import (
 from myst_parser.parsers.docutils_ import Parser as MystParser
 from sphinx.util.docutils import SphinxDirective
 
-# Helper functions for building documentation nodes
+try:
+    import orjson
+except ImportError:  # optional, faster JSON decoding for large IR files
+    orjson = None
+
+# Known external modules that should be linked via intersphinx.
+# None of them has more than two dotted segments (see _match_external_module).
+_EXTERNAL_MODULES = frozenset({
+    'builtins', 'typing', 'collections', 'collections.abc',
+    'typing_extensions', 'decimal', 'datetime', 'pathlib',
+    'numpy', 'numpy.typing'
+})
+
+# Special constants (not in intersphinx, render as text)
+_SPECIAL_CONSTANTS = frozenset({'None', 'True', 'False'})
+
+# Bare builtins are not in Python's intersphinx inventory (render as text)
+_BARE_BUILTINS = frozenset({
+    'int', 'str', 'float', 'bool', 'bytes', 'list', 'dict',
+    'tuple', 'set', 'frozenset', 'type', 'object', 'complex',
+})
+
+# Bare typing names documented as py:data in Python's intersphinx inventory
+_TYPING_DATA = frozenset({
+    'Any', 'Optional', 'Literal', 'LiteralString', 'AnyStr',
+    'NoReturn', 'Never', 'Self', 'TypeAlias', 'ClassVar', 'Final',
+})
+
+# Bare typing names documented as py:class in Python's intersphinx inventory
+_TYPING_CLASS = frozenset({'Union', 'TypeVar', 'Generic', 'Protocol'})
+
+# Intersphinx reftype of typing.<name>; names not listed are py:class
+_TYPING_REFTYPE = {
+    **dict.fromkeys(_TYPING_DATA, 'data'),
+    **dict.fromkeys(_TYPING_CLASS, 'class'),
+}
+
+# Bare collections.abc names (py:class)
+_COLLECTIONS_ABC_TYPES = frozenset({
+    'Sequence', 'Mapping', 'Callable', 'Iterable', 'Iterator',
+    'Collection', 'Container', 'MutableSequence', 'MutableMapping',
+})
+
+
+def _make_xref_prototype(reftype, reftarget, text):
+    xref = pending_xref(
+        '',
+        refdomain='py',
+        reftype=reftype,
+        reftarget=reftarget,
+        refexplicit=False,
+    )
+    xref += nodes.Text(text)
+    return xref
 
-def _parse_and_link_type(type_str):
-    """Parse type string and create intersphinx links for external types"""
-    # Known external modules that should be linked via intersphinx
-    EXTERNAL_MODULES = {
-        'builtins', 'typing', 'collections', 'collections.abc',
-        'typing_extensions', 'decimal', 'datetime', 'pathlib',
-        'numpy', 'numpy.typing'
-    }
 
-    # Special constants
-    SPECIAL_CONSTANTS = {'None': 'constants', 'True': 'constants', 'False': 'constants'}
+# Prebuilt cross-references for the bare typing/collections.abc vocabulary.
+# Nodes cannot be shared between parents, so callers must deepcopy() them.
+_XREF_PROTOTYPES = {
+    **{name: _make_xref_prototype('data', f'typing.{name}', name) for name in _TYPING_DATA},
+    **{name: _make_xref_prototype('class', f'typing.{name}', name) for name in _TYPING_CLASS},
+    **{name: _make_xref_prototype('class', f'collections.abc.{name}', name)
+       for name in _COLLECTIONS_ABC_TYPES},
+}
+
+# Classification of every known bare name in a single lookup:
+# None means plain Text, otherwise the xref prototype to deepcopy.
+_BARE_NAME_TABLE = {
+    **dict.fromkeys(_SPECIAL_CONSTANTS | _BARE_BUILTINS),
+    **_XREF_PROTOTYPES,
+}
+
+# Sphinx reftype for each ItemKind of a link target ('obj' if unknown)
+_KIND_TO_REFTYPE = {
+    'Class': 'class',
+    'Function': 'func',
+    'TypeAlias': 'data',
+    'Variable': 'data',
+    'Module': 'mod',
+}
+
+# Sentinel for names missing from _BARE_NAME_TABLE
+_UNKNOWN_NAME = object()
+
+# Type string tokens: whitespace run, bracket/separator, qualified name or
+# identifier, or a run of anything else (up to the next token of another kind)
+_TYPE_TOKEN_RE = re.compile(
+    r'(\s+)|([\[\](),|])|([a-zA-Z_][a-zA-Z0-9_.]*)|([^\s\[\](),|a-zA-Z_]+)'
+)
+_TOKEN_IDENT = 3
 
-    # Recursively parse and link types
+# Helper functions for building documentation nodes
+
+def _match_external_module(parts):
+    """Return the longest known external module prefixing a dotted name, or None
+
+    Known modules have at most two segments, so only the two-segment and
+    one-segment prefixes need probing.
+    """
+    if len(parts) >= 2:
+        module = f'{parts[0]}.{parts[1]}'
+        if module in _EXTERNAL_MODULES:
+            return module
+    if parts[0] in _EXTERNAL_MODULES:
+        return parts[0]
+    return None
+
+@lru_cache(maxsize=4096)
+def _parse_and_link_type_template(type_str):
+    """Parse type string and create intersphinx links for external types (cached)
+
+    The returned container is a template shared between callers; use
+    _parse_and_link_type, which returns a fresh deep copy.
+    """
+    # Tokenize and link types in a single pass
     def parse_recursive(s):
         result = []
-        i = 0
-
-        while i < len(s):
-            # Skip whitespace
-            if s[i].isspace():
-                result.append(nodes.Text(s[i]))
-                i += 1
-                continue
 
-            # Handle brackets and special chars
-            if s[i] in '[](),|':
-                result.append(nodes.Text(s[i]))
-                i += 1
+        for match in _TYPE_TOKEN_RE.finditer(s):
+            if match.lastindex != _TOKEN_IDENT:
+                # Whitespace runs, brackets/separators and unrecognized
+                # characters (e.g. digits, quotes in Literal[...]) as text
+                result.append(nodes.Text(match.group()))
                 continue
 
-            # Try to match a qualified name or identifier
-            match = re.match(r'([a-zA-Z_][a-zA-Z0-9_.]*)', s[i:])
-            if match:
-                name = match.group(1)
-                i += len(name)
-
-                # Check for special constants (not in intersphinx, render as text)
-                if name in SPECIAL_CONSTANTS:
+            name = match.group()
+            entry = _BARE_NAME_TABLE.get(name, _UNKNOWN_NAME)
+            if entry is None:
+                # Special constants and bare builtins render as text
+                result.append(nodes.Text(name))
+            elif entry is not _UNKNOWN_NAME:
+                # Bare typing and collections.abc types
+                result.append(entry.deepcopy())
+            # Check if it's a qualified external type
+            elif '.' in name:
+                parts = name.split('.')
+                module = _match_external_module(parts)
+                if module is None:
+                    # Not an external type
                     result.append(nodes.Text(name))
-                    continue
-
-                # Check if it's a qualified external type
-                if '.' in name:
-                    parts = name.split('.')
-                    # Try to find which part is the module
-                    for k in range(len(parts), 0, -1):
-                        module = '.'.join(parts[:k])
-                        if module in EXTERNAL_MODULES:
-                            # Skip builtins - they're not in intersphinx inventory
-                            if module == 'builtins':
-                                result.append(nodes.Text(name))
-                                break
-
-                            # Determine reftype based on module and type name
-                            type_name = parts[-1]
-                            if module == 'typing':
-                                # Check if it's py:data or py:class in typing module
-                                if type_name in ('Any', 'Optional', 'Literal', 'LiteralString',
-                                                 'AnyStr', 'NoReturn', 'Never', 'Self',
-                                                 'TypeAlias', 'ClassVar', 'Final'):
-                                    reftype = 'data'
-                                else:
-                                    reftype = 'class'
-                            else:
-                                reftype = 'class'
-
-                            xref = pending_xref(
-                                '',
-                                refdomain='py',
-                                reftype=reftype,
-                                reftarget=name,
-                                refexplicit=False,
-                            )
-                            xref += nodes.literal(text=name)
-                            result.append(xref)
-                            break
-                    else:
-                        # Not an external type
-                        result.append(nodes.Text(name))
-                # Check for bare builtins (not in intersphinx, render as text)
-                elif name in ('int', 'str', 'float', 'bool', 'bytes', 'list', 'dict',
-                              'tuple', 'set', 'frozenset', 'type', 'object', 'complex'):
-                    # Bare builtins are not in Python's intersphinx inventory
+                elif module == 'builtins':
+                    # Skip builtins - they're not in intersphinx inventory
                     result.append(nodes.Text(name))
-                # Check for bare typing types (mixed py:class and py:data)
-                elif name in ('Any', 'Optional', 'Literal', 'LiteralString', 'AnyStr',
-                              'NoReturn', 'Never', 'Self', 'TypeAlias', 'ClassVar', 'Final'):
-                    # These are py:data in Python's intersphinx
-                    xref = pending_xref(
-                        '',
-                        refdomain='py',
-                        reftype='data',
-                        reftarget=f'typing.{name}',
-                        refexplicit=False,
-                    )
-                    xref += nodes.Text(name)
-                    result.append(xref)
-                elif name in ('Union', 'TypeVar', 'Generic', 'Protocol'):
-                    # These are py:class in Python's intersphinx
-                    xref = pending_xref(
-                        '',
-                        refdomain='py',
-                        reftype='class',
-                        reftarget=f'typing.{name}',
-                        refexplicit=False,
-                    )
-                    xref += nodes.Text(name)
-                    result.append(xref)
-                # Check for bare collections.abc types
-                elif name in ('Sequence', 'Mapping', 'Callable', 'Iterable', 'Iterator',
-                              'Collection', 'Container', 'MutableSequence', 'MutableMapping'):
+                else:
+                    # Determine reftype based on module and type name
+                    if module == 'typing':
+                        # py:data or py:class in typing module
+                        reftype = _TYPING_REFTYPE.get(parts[-1], 'class')
+                    else:
+                        reftype = 'class'
+
                     xref = pending_xref(
                         '',
                         refdomain='py',
-                        reftype='class',
-                        reftarget=f'collections.abc.{name}',
+                        reftype=reftype,
+                        reftarget=name,
                         refexplicit=False,
                     )
-                    xref += nodes.Text(name)
+                    xref += nodes.literal(text=name)
                     result.append(xref)
-                else:
-                    # Unknown type, don't link
-                    result.append(nodes.Text(name))
             else:
-                # Unrecognized character
-                result.append(nodes.Text(s[i]))
-                i += 1
+                # Unknown type, don't link
+                result.append(nodes.Text(name))
 
         return result
 
@@ -155,89 +194,124 @@ def _parse_and_link_type(type_str):
         container += node
     return container
 
-def _build_type_expr(type_expr):
-    """Build type expression with intersphinx linking for external types
+def _parse_and_link_type(type_str):
+    """Parse type string and create intersphinx links for external types"""
+    return _parse_and_link_type_template(type_str).deepcopy()
 
-    Recursively handles nested types from the children field.
-    """
-    display = type_expr['display']
-    link_target = type_expr.get('link_target')
-    children = type_expr.get('children', [])
-
-    # Case 1: Type with link target and children (e.g., Generic[T] where Generic has a link)
-    if link_target and children:
-        # Build the base type with link
-        base_name = display.split('[')[0] if '[' in display else display
-        xref = pending_xref(
-            '',
-            refdomain='py',
-            reftype=_kind_to_reftype(link_target['kind']),
-            reftarget=link_target['fqn'],
-            refexplicit=True,
-        )
-        xref += nodes.Text(base_name)
+def _build_linked_generic(display, link_target, child_nodes):
+    """Case 1: Type with link target and children (e.g., Generic[T] where Generic has a link)"""
+    # Build the base type with link
+    base_name = display.split('[')[0] if '[' in display else display
+    xref = pending_xref(
+        '',
+        refdomain='py',
+        reftype=_KIND_TO_REFTYPE.get(link_target['kind'], 'obj'),
+        reftarget=link_target['fqn'],
+        refexplicit=True,
+    )
+    xref += nodes.Text(base_name)
 
-        # Build the generic part with children
-        return _build_generic_with_children(xref, children)
+    # Build the generic part with children
+    return _build_generic_with_children(xref, child_nodes)
 
-    # Case 2: Type with link target but no children (simple type)
-    elif link_target:
-        # Create pending_xref for our own types
-        xref = pending_xref(
-            '',
-            refdomain='py',
-            reftype=_kind_to_reftype(link_target['kind']),
-            reftarget=link_target['fqn'],
-            refexplicit=True,
-        )
-        xref += nodes.Text(display)
-        return xref
 
-    # Case 3: Union type (has children but no link_target)
-    elif children:
-        # Check if this is a union type by looking for '|' in display
-        if '|' in display:
-            return _build_union_type(children)
-        # Otherwise it's a generic type with no base link (e.g., typing.Optional)
-        else:
-            # Extract base name
-            base_name = display.split('[')[0] if '[' in display else display
-            # Parse base to potentially link it via intersphinx
-            base_node = _parse_and_link_type(base_name)
-            return _build_generic_with_children(base_node, children)
+def _build_linked_simple(display, link_target, child_nodes):
+    """Case 2: Type with link target but no children (simple type)"""
+    # Create pending_xref for our own types
+    xref = pending_xref(
+        '',
+        refdomain='py',
+        reftype=_KIND_TO_REFTYPE.get(link_target['kind'], 'obj'),
+        reftarget=link_target['fqn'],
+        refexplicit=True,
+    )
+    xref += nodes.Text(display)
+    return xref
+
+
+def _build_unlinked_generic_or_union(display, link_target, child_nodes):
+    """Case 3: Union or generic type (has children but no link_target)"""
+    # Check if this is a union type by looking for '|' in display
+    if '|' in display:
+        return _build_union_type(child_nodes)
+    # Otherwise it's a generic type with no base link (e.g., typing.Optional)
+    # Extract base name
+    base_name = display.split('[')[0] if '[' in display else display
+    # Parse base to potentially link it via intersphinx
+    base_node = _parse_and_link_type(base_name)
+    return _build_generic_with_children(base_node, child_nodes)
 
-    # Case 4: External type or simple builtin (no link, no children)
-    else:
-        # Parse the type expression and create intersphinx links for external types
-        return _parse_and_link_type(display)
 
+def _build_plain(display, link_target, child_nodes):
+    """Case 4: External type or simple builtin (no link, no children)"""
+    # Parse the type expression and create intersphinx links for external types
+    return _parse_and_link_type(display)
 
-def _build_generic_with_children(base_node, children):
-    """Build a generic type expression like Base[T1, T2] with linked children"""
+
+# Dispatch on (has link_target, has children)
+_TE_DISPATCH = {
+    (True, True): _build_linked_generic,
+    (True, False): _build_linked_simple,
+    (False, True): _build_unlinked_generic_or_union,
+    (False, False): _build_plain,
+}
+
+
+def _build_type_expr(type_expr):
+    """Build type expression with intersphinx linking for external types
+
+    Handles nested types from the children field with an iterative post-order
+    traversal: each node is built after its children, whose built nodes are
+    popped from an output stack.
+    """
+    if not type_expr.get('children') and not type_expr.get('link_target'):
+        # Plain leaf (the common case): no traversal needed
+        return _parse_and_link_type(type_expr['display'])
+
+    built = []
+    stack = [(type_expr, False)]
+    while stack:
+        expr, children_built = stack.pop()
+        children = expr.get('children', [])
+        if children and not children_built:
+            # Revisit this node once all of its children have been built
+            stack.append((expr, True))
+            stack.extend((child, False) for child in reversed(children))
+            continue
+
+        child_nodes = []
+        if children:
+            child_nodes = built[-len(children):]
+            del built[-len(children):]
+        link_target = expr.get('link_target')
+        builder = _TE_DISPATCH[(bool(link_target), bool(children))]
+        built.append(builder(expr['display'], link_target, child_nodes))
+
+    return built[0]
+
+
+def _build_generic_with_children(base_node, child_nodes):
+    """Build a generic type expression like Base[T1, T2] from built children"""
     container = nodes.inline()
     container += base_node
     container += nodes.Text('[')
 
-    for i, child in enumerate(children):
+    for i, child_node in enumerate(child_nodes):
         if i > 0:
             container += nodes.Text(', ')
-        # Recursively render child
-        child_node = _build_type_expr(child)
         container += child_node
 
     container += nodes.Text(']')
     return container
 
 
-def _build_union_type(children):
-    """Build a union type expression like A | B | C with linked children"""
+def _build_union_type(child_nodes):
+    """Build a union type expression like A | B | C from built children"""
     container = nodes.inline()
 
-    for i, child in enumerate(children):
+    for i, child_node in enumerate(child_nodes):
         if i > 0:
             container += nodes.Text(' | ')
-        # Recursively render child
-        child_node = _build_type_expr(child)
         container += child_node
 
     return container
@@ -262,7 +336,7 @@ def _build_link_from_target(text, link_target):
     xref = pending_xref(
         '',
         refdomain='py',
-        reftype=_kind_to_reftype(link_target['kind']),
+        reftype=_KIND_TO_REFTYPE.get(link_target['kind'], 'obj'),
         reftarget=link_target['fqn'],
         refexplicit=True,
     )
@@ -279,27 +353,27 @@ def _build_default_value(default_value):
         expr = default_value['display']
         type_refs = default_value.get('type_refs', [])
 
-        # Sort by offset descending to insert links from right to left
+        # Walk references left to right, emitting the text between them
         nodes_list = []
-        last_pos = len(expr)
+        pos = 0
 
-        for ref in sorted(type_refs, key=lambda r: r['offset'], reverse=True):
-            # Add text after this reference
-            if ref['offset'] + len(ref['text']) < last_pos:
-                nodes_list.insert(0, nodes.Text(expr[ref['offset'] + len(ref['text']):last_pos]))
+        for ref in sorted(type_refs, key=lambda r: r['offset']):
+            offset = ref['offset']
+            # Add text before this reference
+            if offset > pos:
+                nodes_list.append(nodes.Text(expr[pos:offset]))
 
             # Add linked reference (entire C.C1, not just C)
             if ref.get('link_target'):
-                xref = _build_link_from_target(ref['text'], ref['link_target'])
-                nodes_list.insert(0, xref)
+                nodes_list.append(_build_link_from_target(ref['text'], ref['link_target']))
             else:
-                nodes_list.insert(0, nodes.Text(ref['text']))
+                nodes_list.append(nodes.Text(ref['text']))
 
-            last_pos = ref['offset']
+            pos = offset + len(ref['text'])
 
-        # Add remaining text before first reference
-        if last_pos > 0:
-            nodes_list.insert(0, nodes.Text(expr[:last_pos]))
+        # Add remaining text after the last reference
+        if pos < len(expr):
+            nodes_list.append(nodes.Text(expr[pos:]))
 
         # Return a container with all nodes
         container = nodes.inline(classes=['default_value'])
@@ -310,6 +384,103 @@ def _build_default_value(default_value):
     # Fallback for unknown kinds
     return nodes.Text(str(default_value))
 
+# Guards the shared parser: a docutils parser keeps per-parse state on the
+# instance, so it must not be used by two threads at once. (Sphinx's own
+# parallel read/write uses processes, where every cache here is per-process.)
+_MYST_PARSER_LOCK = threading.RLock()
+
+def _get_myst_parser(env):
+    """Return the MyST parser shared across the build
+
+    setup() stores one instance on the Sphinx app; building a parser per
+    docstring is comparatively expensive. Falls back to a fresh instance when
+    no app is available.
+    """
+    parser = getattr(getattr(env, 'app', None), '_pyo3_myst_parser', None)
+    return parser if parser is not None else MystParser()
+
+@lru_cache(maxsize=1)
+def _valid_myst_settings():
+    """Names of the settings MyST's docutils parser accepts (computed once)
+
+    Read dynamically from the parser's settings_spec; this avoids hard-coding
+    a setting list that will become stale.
+    """
+    valid_myst_settings = set()
+
+    # settings_spec is a tuple: (title, description, option_spec_tuple)
+    settings_spec = getattr(MystParser, 'settings_spec', None)
+    if settings_spec:
+        # settings_spec[2] contains the tuple of setting definitions
+        for setting_def in settings_spec[2]:
+            # Each setting_def is (description, options, kwargs)
+            # kwargs contains 'dest' which is the setting name
+            if len(setting_def) >= 3 and isinstance(setting_def[2], dict):
+                dest = setting_def[2].get('dest')
+                if dest:
+                    valid_myst_settings.add(dest)
+
+    return frozenset(valid_myst_settings)
+
+@lru_cache(maxsize=8)
+def _myst_settings_overrides(env):
+    """Docutils settings overrides for parsing docstrings in `env` (cached)
+
+    The config does not change during a build, so this is resolved once per
+    environment. publish_doctree copies the overrides, so sharing is safe.
+    """
+    # Base settings
+    settings_overrides = {
+        'report_level': 5,  # Suppress warnings
+        'halt_level': 5,
+    }
+
+    # Add env to settings if provided
+    if env is not None:
+        settings_overrides['env'] = env
+
+        # Extract MyST configuration from Sphinx app config
+        # This enables all MyST extensions configured in conf.py
+        if hasattr(env, 'app') and hasattr(env.app, 'config'):
+            config = env.app.config
+
+            # Copy only valid MyST settings from Sphinx config to parser settings
+            for setting_name in _valid_myst_settings():
+                if hasattr(config, setting_name):
+                    value = getattr(config, setting_name)
+                    # Only set non-default values
+                    # Note: MyST uses UNSET as a sentinel, but we check for None here
+                    # as that's what Sphinx config will have for unset values
+                    if value is not None:
+                        settings_overrides[setting_name] = value
+
+    return settings_overrides
+
+@lru_cache(maxsize=4096)
+def _parse_myst_cached(dedented_text, env, docname):
+    """Parse dedented MyST markdown once per (text, env, docname)
+
+    Identical docstrings (boilerplate, inherited enum members, ...) are common,
+    so the parsed nodes are cached. The returned tuple is a template that must
+    not be inserted into a document; _parse_myst hands out deep copies.
+    docname is part of the key because cross-reference nodes record the
+    document they were parsed in. Parse failures raise and are not cached.
+    """
+    # Reuse the parser created in setup() (see _get_myst_parser)
+    parser = _get_myst_parser(env)
+
+    settings_overrides = _myst_settings_overrides(env)
+
+    # Parse markdown using docutils core API with MyST parser
+    with _MYST_PARSER_LOCK:
+        doctree = publish_doctree(
+            dedented_text,
+            parser=parser,
+            settings_overrides=settings_overrides
+        )
+
+    return tuple(doctree.children)
+
 def _parse_myst(markdown_text, env=None):
     """Parse MyST markdown to docutils nodes using myst-parser
 
@@ -320,70 +491,21 @@ def _parse_myst(markdown_text, env=None):
         markdown_text: The MyST markdown text to parse
         env: Optional Sphinx environment (required for MyST features to work correctly)
     """
-    from docutils.core import publish_doctree
-    import textwrap
-
     try:
         # Dedent the text to avoid markdown treating it as a code block
-        # (indented text in markdown is interpreted as preformatted code)
+        # (indented text in markdown is interpreted as preformatted code).
+        # Done before the cache lookup so docstrings that differ only in
+        # indentation share one entry.
         dedented_text = textwrap.dedent(markdown_text).strip()
-
-        # Base settings
-        settings_overrides = {
-            'report_level': 5,  # Suppress warnings
-            'halt_level': 5,
-        }
-
-        # Add env to settings if provided
-        if env is not None:
-            settings_overrides['env'] = env
-
-            # Extract MyST configuration from Sphinx app config
-            # This enables all MyST extensions configured in conf.py
-            if hasattr(env, 'app') and hasattr(env.app, 'config'):
-                config = env.app.config
-
-                # Dynamically get valid MyST settings from the parser
-                # This avoids hard-coding a setting list that will become stale
-                parser_instance = MystParser()
-                valid_myst_settings = set()
-
-                # Extract setting names from parser's settings_spec
-                # settings_spec is a tuple: (title, description, option_spec_tuple)
-                if hasattr(parser_instance, 'settings_spec') and parser_instance.settings_spec:
-                    # settings_spec[2] contains the tuple of setting definitions
-                    for setting_def in parser_instance.settings_spec[2]:
-                        # Each setting_def is (description, options, kwargs)
-                        # kwargs contains 'dest' which is the setting name
-                        if len(setting_def) >= 3 and isinstance(setting_def[2], dict):
-                            dest = setting_def[2].get('dest')
-                            if dest:
-                                valid_myst_settings.add(dest)
-
-                # Copy only valid MyST settings from Sphinx config to parser settings
-                for setting_name in valid_myst_settings:
-                    if hasattr(config, setting_name):
-                        value = getattr(config, setting_name)
-                        # Only set non-default values
-                        # Note: MyST uses UNSET as a sentinel, but we check for None here
-                        # as that's what Sphinx config will have for unset values
-                        if value is not None:
-                            settings_overrides[setting_name] = value
-
-        # Parse markdown using docutils core API with MyST parser
-        doctree = publish_doctree(
-            dedented_text,
-            parser=MystParser(),
-            settings_overrides=settings_overrides
-        )
-
-        # Return the list of child nodes directly (not wrapped in a container)
-        # This allows the caller to add them to any parent node
-        return list(doctree.children)
+        docname = env.docname if env is not None else None
+        template = _parse_myst_cached(dedented_text, env, docname)
     except Exception:
         # Fallback to simple paragraph if parsing fails
         return [nodes.paragraph(text=markdown_text.strip())]
 
+    # Fresh copies so cached nodes are never attached to a document
+    return [node.deepcopy() for node in template]
+
 def _extract_first_line_doc(doc_string, max_length=100):
     """Extract first line from docstring for summary
 
@@ -469,45 +591,69 @@ def _append_myst_doc(parent_node, doc, env):
             for node in _parse_myst(doc, env):
                 parent.append(node)
 
+    `parent_node` may also be a plain list, to collect children before
+    deciding whether a container node is needed at all.
+
     Usage: _append_myst_doc(content, func.get('doc'), env)
     """
     if doc:
-        for node in _parse_myst(doc, env):
-            parent_node.append(node)
+        parent_node.extend(_parse_myst(doc, env))
 
-def _register_py_object(env, fullname, objtype, node_id):
-    """Helper: Register object with Python domain for cross-references
+def _make_registrar(env, py_domain):
+    """Return (register, flush) for one directive run
 
-    Replaces repeated pattern:
-        if hasattr(env, 'domaindata'):
-            py_domain = env.get_domain('py')
-            py_domain.note_object(fullname, objtype, node_id, location=env.docname)
-
-    Usage: _register_py_object(env, fullname, 'function', sig_id)
+    register(fullname, objtype, node_id) queues an object for the Python
+    domain, skipping (fullname, objtype) pairs already queued during the same
+    run. flush() notes the queued objects in one pass once rendering is done.
     """
-    if hasattr(env, 'domaindata'):
-        py_domain = env.get_domain('py')
-        py_domain.note_object(fullname, objtype, node_id, location=env.docname)
+    registered = set()
+    pending = []
+
+    def register(fullname, objtype, node_id):
+        key = (fullname, objtype)
+        if key in registered:
+            return
+        registered.add(key)
+        pending.append((fullname, objtype, node_id))
 
-def _kind_to_reftype(kind):
-    """Helper: Map ItemKind to Sphinx reftype
+    def flush():
+        note_object = py_domain.note_object
+        docname = env.docname
+        for fullname, objtype, node_id in pending:
+            note_object(fullname, objtype, node_id, location=docname)
+        pending.clear()
 
-    Eliminates repeated dict literal:
-        kind_to_reftype = {
-            'Class': 'class',
-            'Function': 'func',
-            ...
-        }
+    return register, flush
 
-    Usage: reftype = _kind_to_reftype(link_target['kind'])
+def _colon():
+    """Separator for `name: type` signatures (a Text node has one parent, so build a fresh one)"""
+    return nodes.Text(': ')
+
+def _render_signature(sig_node, name, sig):
+    """Append name, parameter list (types and defaults) and return annotation
+
+    The per-overload body shared by functions and methods.
     """
-    return {
-        'Class': 'class',
-        'Function': 'func',
-        'TypeAlias': 'data',
-        'Variable': 'data',
-        'Module': 'mod',
-    }.get(kind, 'obj')
+    # Parameters
+    param_nodes = []
+    for param in sig['parameters']:
+        param_children = [
+            nodes.Text(param['name'] + ': '),
+            _build_type_expr_cached(param['type_']),
+        ]
+        if param.get('default'):
+            param_children.append(nodes.Text(' = '))
+            param_children.append(_build_default_value(param['default']))
+        param_nodes.append(desc_parameter('', '', *param_children))
+
+    # Function/method name and parameters
+    children = [desc_name(text=name), desc_parameterlist('', '', *param_nodes)]
+
+    # Return type
+    if sig.get('return_type'):
+        children.append(desc_returns('', '', _build_type_expr_cached(sig['return_type'])))
+
+    sig_node.extend(children)
 
 def _build_callable_signatures(signatures, name, module_name, fullname, env):
     """Build signature nodes for functions/methods with all overloads
@@ -524,52 +670,35 @@ def _build_callable_signatures(signatures, name, module_name, fullname, env):
 
     for idx, sig in enumerate(signatures):
         sig_node = desc_signature(module=module_name, fullname=fullname)
-        sig_node['module'] = module_name
-        sig_node['fullname'] = fullname
 
         # Only first signature gets the ID
         if idx == 0:
             sig_node['ids'].append(fullname)
         sig_node['first'] = (idx == 0)
 
-        # Function/method name
-        sig_node += desc_name(text=name)
-
-        # Parameters
-        param_list = desc_parameterlist()
-        for param in sig['parameters']:
-            param_node = desc_parameter()
-            param_node += nodes.Text(param['name'] + ': ')
-            param_node += _build_type_expr(param['type_'])
-
-            if param.get('default'):
-                param_node += nodes.Text(' = ')
-                param_node += _build_default_value(param['default'])
-
-            param_list += param_node
-        sig_node += param_list
-
-        # Return type
-        if sig.get('return_type'):
-            returns = desc_returns()
-            returns += _build_type_expr(sig['return_type'])
-            sig_node += returns
-
+        _render_signature(sig_node, name, sig)
         sig_nodes.append(sig_node)
 
     return sig_nodes
 
-@lru_cache(maxsize=512)
-def _parse_and_link_type_cached(type_str):
-    """Cached version of _parse_and_link_type
-
-    Many types repeat across signatures (int, str, Optional[...])
-    Cache avoids re-parsing regex and building node trees.
+@lru_cache(maxsize=2048)
+def _build_type_expr_template(type_key):
+    """Build a type expression from its canonical JSON form (cached)
 
-    Note: Returns a node object which is mutable, but since we don't
-    modify these after creation, caching is safe.
+    The same types (str, Optional[Foo], ...) recur across parameters, returns
+    and attributes. The cached node is a template: use _build_type_expr_cached,
+    which returns a fresh deep copy, since a node can only have one parent.
     """
-    return _parse_and_link_type(type_str)
+    return _build_type_expr(json.loads(type_key))
+
+def _build_type_expr_cached(type_expr):
+    """Cached version of _build_type_expr"""
+    if not type_expr.get('children') and not type_expr.get('link_target'):
+        # Plain leaf: _parse_and_link_type is already memoized on the display
+        # string, so skip building a JSON key
+        return _parse_and_link_type(type_expr['display'])
+    type_key = json.dumps(type_expr, sort_keys=True)
+    return _build_type_expr_template(type_key).deepcopy()
 
 @lru_cache(maxsize=256)
 def _extract_first_line_doc_cached(doc_string, max_length=100):
@@ -581,29 +710,14 @@ def _extract_first_line_doc_cached(doc_string, max_length=100):
     return _extract_first_line_doc(doc_string, max_length)
 
 def _group_items_by_kind(items):
-    """Group module items by kind for contents table
+    """Group module items by kind in a single pass
 
-    Returns: dict with keys 'functions', 'classes', 'type_aliases', 'variables'
-    Each value is a list of items of that kind.
+    Returns: defaultdict(list) keyed by item kind ('Function', 'Class',
+    'TypeAlias', 'Variable', 'Module').
     """
-    groups = {
-        'functions': [],
-        'classes': [],
-        'type_aliases': [],
-        'variables': []
-    }
-
+    groups = defaultdict(list)
     for item in items:
-        kind = item['kind']
-        if kind == 'Function':
-            groups['functions'].append(item)
-        elif kind == 'Class':
-            groups['classes'].append(item)
-        elif kind == 'TypeAlias':
-            groups['type_aliases'].append(item)
-        elif kind == 'Variable':
-            groups['variables'].append(item)
-
+        groups[item['kind']].append(item)
     return groups
 
 def _get_reftype_for_item(item):
@@ -692,41 +806,45 @@ def _build_contents_table(env, category_title, items, module_name):
 
     return [rubric, table]
 
-def _build_module_contents_table(env, doc_module, module_name):
+def _build_module_contents_table(env, groups, module_name):
     """Build module contents table with categorized items
 
+    `groups` is the output of _group_items_by_kind for the module's items.
+
     Returns list of nodes (section with rubrics and tables).
     """
-    # Group items by kind (using helper)
-    groups = _group_items_by_kind(doc_module['items'])
+    classes = groups.get('Class')
+    functions = groups.get('Function')
+    type_aliases = groups.get('TypeAlias')
+    variables = groups.get('Variable')
 
     # Skip if module has no items to show
-    if not any(groups.values()):
+    if not (classes or functions or type_aliases or variables):
         return []
 
     # Create section
-    section = nodes.section(ids=[f'{module_name}-contents'])
+    section = nodes.section(ids=[_section_ids(module_name)['contents']])
     section += nodes.title(text='Module Contents')
 
     # Build each category (in this specific order)
-    if groups['classes']:
+    if classes:
         section.extend(_build_contents_table(
-            env, 'Classes', groups['classes'], module_name
+            env, 'Classes', classes, module_name
         ))
 
-    if groups['functions']:
+    if functions:
         section.extend(_build_contents_table(
-            env, 'Functions', groups['functions'], module_name
+            env, 'Functions', functions, module_name
         ))
 
-    if groups['type_aliases']:
+    if type_aliases:
         section.extend(_build_contents_table(
-            env, 'Type Aliases', groups['type_aliases'], module_name
+            env, 'Type Aliases', type_aliases, module_name
         ))
 
-    if groups['variables']:
+    if variables:
         section.extend(_build_contents_table(
-            env, 'Variables', groups['variables'], module_name
+            env, 'Variables', variables, module_name
         ))
 
     return [section]
@@ -756,7 +874,7 @@ def _build_deprecated_note(deprecated):
     container += content_para
     return container
 
-def _build_function(env, func, module_name):
+def _build_function(env, func, module_name, register):
     """Build function with all overload signatures"""
     fullname = f"{module_name}.{func['name']}"
 
@@ -767,27 +885,27 @@ def _build_function(env, func, module_name):
     desc_node['classes'].extend(['py', 'function'])
 
     # Add signature for each overload (using consolidated helper)
-    for sig_node in _build_callable_signatures(
+    desc_node.extend(_build_callable_signatures(
         func['signatures'], func['name'], module_name, fullname, env
-    ):
-        desc_node += sig_node
+    ))
 
-    # Docstring and deprecation (using helper)
-    content = desc_content()
+    # Docstring and deprecation; desc_content is only created when non-empty
+    content_nodes = []
     dep_note = _build_deprecated_note(func.get('deprecated'))
     if dep_note is not None:
-        content += dep_note
+        content_nodes.append(dep_note)
     if func.get('doc'):
-        _append_myst_doc(content, func['doc'], env)
-    if len(content.children) > 0:
-        desc_node += content
+        _append_myst_doc(content_nodes, func['doc'], env)
+    if content_nodes:
+        desc_node += desc_content('', *content_nodes)
 
-    # Register (using helper)
-    _register_py_object(env, fullname, 'function', fullname)
+    # Register with Python domain
+    register(fullname, 'function', fullname)
 
-    return [index_node, desc_node]
+    yield index_node
+    yield desc_node
 
-def _build_type_alias(env, alias, module_name):
+def _build_type_alias(env, alias, module_name, register):
     """Build type alias documentation"""
     fullname = f"{module_name}.{alias['name']}"
 
@@ -797,15 +915,13 @@ def _build_type_alias(env, alias, module_name):
     desc_node = desc(domain='py', objtype='data', noindex=False)
 
     sig_node = desc_signature(module=module_name, fullname=fullname)
-    sig_node['module'] = module_name
-    sig_node['fullname'] = fullname
     sig_node['ids'].append(fullname)
 
     # Use Python 3.12+ type syntax
     sig_node += desc_annotation(text='type ')
     sig_node += desc_name(text=alias['name'])
     sig_node += nodes.Text(' = ')
-    sig_node += _build_type_expr(alias['definition'])
+    sig_node += _build_type_expr_cached(alias['definition'])
     desc_node += sig_node
 
     # Docstring (using helper)
@@ -814,12 +930,13 @@ def _build_type_alias(env, alias, module_name):
         _append_myst_doc(content, alias['doc'], env)
         desc_node += content
 
-    # Register (using helper)
-    _register_py_object(env, fullname, 'data', fullname)
+    # Register with Python domain
+    register(fullname, 'data', fullname)
 
-    return [index_node, desc_node]
+    yield index_node
+    yield desc_node
 
-def _build_class(env, cls, module_name):
+def _build_class(env, cls, module_name, register):
     """Build class documentation"""
     fullname = f"{module_name}.{cls['name']}"
     sig_id = fullname
@@ -831,8 +948,6 @@ def _build_class(env, cls, module_name):
     desc_node['classes'].extend(['py', 'class'])
 
     sig_node = desc_signature(module=module_name, fullname=fullname)
-    sig_node['module'] = module_name
-    sig_node['fullname'] = fullname
     sig_node['ids'].append(sig_id)
 
     # Add "class" prefix annotation with syntax highlighting
@@ -861,94 +976,108 @@ def _build_class(env, cls, module_name):
         content += dep_note
     _append_myst_doc(content, cls.get('doc'), env)
 
-    # Register with Python domain (using helper)
-    _register_py_object(env, fullname, 'class', sig_id)
+    # Register with Python domain
+    register(fullname, 'class', sig_id)
+
+    # Method and attribute nodes are collected and attached to content at once
+    member_nodes = []
+
+    # Local aliases for helpers called once per member
+    create_index = _create_index_node
+    append_doc = _append_myst_doc
 
     # Render class methods
     methods = cls.get('methods', [])
     for method in methods:
-        method_fullname = f"{fullname}.{method['name']}"
+        name = method['name']
+        doc = method.get('doc')
+        deprecated = method.get('deprecated')
+        method_fullname = f"{fullname}.{name}"
 
         # ADD INDEX NODE for method
-        method_index = _create_index_node(method_fullname, 'method', method['name'])
-        content += method_index
+        method_index = create_index(method_fullname, 'method', name)
+        member_nodes.append(method_index)
 
         method_desc = desc(domain='py', objtype='method', noindex=False)
         method_desc['classes'].extend(['py', 'method'])
 
         # Add signature for each overload (using consolidated helper)
-        for sig_node in _build_callable_signatures(
-            method['signatures'], method['name'], module_name, method_fullname, env
-        ):
-            method_desc += sig_node
+        method_desc.extend(_build_callable_signatures(
+            method['signatures'], name, module_name, method_fullname, env
+        ))
 
         # Method deprecation and docstring (using helper)
-        method_content = desc_content()
-        dep_note = _build_deprecated_note(method.get('deprecated'))
+        method_content = []
+        dep_note = _build_deprecated_note(deprecated)
         if dep_note is not None:
-            method_content += dep_note
-        if method.get('doc'):
-            _append_myst_doc(method_content, method['doc'], env)
-        if len(method_content.children) > 0:
-            method_desc += method_content
+            method_content.append(dep_note)
+        if doc:
+            append_doc(method_content, doc, env)
+        if method_content:
+            method_desc += desc_content('', *method_content)
 
-        # Register method (using helper)
-        _register_py_object(env, method_fullname, 'method', method_fullname)
+        # Register method
+        register(method_fullname, 'method', method_fullname)
 
-        content += method_desc
+        member_nodes.append(method_desc)
 
     # Render class attributes and properties
     attributes = cls.get('attributes', [])
     for attr in attributes:
+        name = attr['name']
+        type_ = attr.get('type_')
+        doc = attr.get('doc')
+        deprecated = attr.get('deprecated')
         is_property = attr.get('is_property', False)
         is_readonly = attr.get('is_readonly', False)
         objtype = 'property' if is_property else 'attribute'
-        attr_fullname = f"{fullname}.{attr['name']}"
+        attr_fullname = f"{fullname}.{name}"
 
         # ADD INDEX NODE for attribute/property
-        attr_index = _create_index_node(attr_fullname, objtype, attr['name'])
-        content += attr_index
+        attr_index = create_index(attr_fullname, objtype, name)
+        member_nodes.append(attr_index)
 
         attr_desc = desc(domain='py', objtype=objtype, noindex=False)
 
         sig_node = desc_signature(module=module_name, fullname=attr_fullname)
-        sig_node['module'] = module_name
-        sig_node['fullname'] = attr_fullname
         sig_node['ids'].append(attr_fullname)
 
         if is_property:
             sig_node += desc_annotation(text='property ')
 
-        sig_node += desc_name(text=attr['name'])
-        if attr.get('type_'):
-            sig_node += nodes.Text(': ')
-            sig_node += _build_type_expr(attr['type_'])
+        sig_node += desc_name(text=name)
+        if type_:
+            sig_node += _colon()
+            sig_node += _build_type_expr_cached(type_)
 
         attr_desc += sig_node
 
         # Attribute/property deprecation and docstring (using helper)
-        attr_content = desc_content()
-        dep_note = _build_deprecated_note(attr.get('deprecated'))
+        attr_content = []
+        dep_note = _build_deprecated_note(deprecated)
         if dep_note is not None:
-            attr_content += dep_note
+            attr_content.append(dep_note)
         if is_readonly:
-            attr_content += nodes.paragraph(text='Read-only property.')
-        if attr.get('doc'):
-            _append_myst_doc(attr_content, attr['doc'], env)
-        if len(attr_content.children) > 0:
-            attr_desc += attr_content
+            attr_content.append(nodes.paragraph(text='Read-only property.'))
+        if doc:
+            append_doc(attr_content, doc, env)
+        if attr_content:
+            attr_desc += desc_content('', *attr_content)
+
+        # Register attribute/property
+        register(attr_fullname, objtype, attr_fullname)
 
-        # Register attribute/property (using helper)
-        _register_py_object(env, attr_fullname, objtype, attr_fullname)
+        member_nodes.append(attr_desc)
 
-        content += attr_desc
+    content.extend(member_nodes)
 
     # Add the complete content block to desc_node
     desc_node += content
 
-    return [index_node, desc_node]
+    yield index_node
+    yield desc_node
 
-def _build_variable(env, var, module_name):
+def _build_variable(env, var, module_name, register):
     """Build variable documentation"""
     fullname = f"{module_name}.{var['name']}"
 
@@ -958,14 +1087,12 @@ def _build_variable(env, var, module_name):
     desc_node = desc(domain='py', objtype='data', noindex=False)
 
     sig_node = desc_signature(module=module_name, fullname=fullname)
-    sig_node['module'] = module_name
-    sig_node['fullname'] = fullname
     sig_node['ids'].append(fullname)
 
     sig_node += desc_name(text=var['name'])
     if var.get('type_'):
-        sig_node += nodes.Text(': ')
-        sig_node += _build_type_expr(var['type_'])
+        sig_node += _colon()
+        sig_node += _build_type_expr_cached(var['type_'])
     desc_node += sig_node
 
     # Docstring (using helper)
@@ -974,10 +1101,11 @@ def _build_variable(env, var, module_name):
         _append_myst_doc(content, var['doc'], env)
         desc_node += content
 
-    # Register (using helper)
-    _register_py_object(env, fullname, 'data', fullname)
+    # Register with Python domain
+    register(fullname, 'data', fullname)
 
-    return [index_node, desc_node]
+    yield index_node
+    yield desc_node
 
 def _build_submodule(env, submod, parent_module_name):
     """Build documentation for a submodule reference"""
@@ -1004,34 +1132,221 @@ def _build_submodule(env, submod, parent_module_name):
 
     # Add docstring if present
     if submod_doc:
-        for node in _parse_myst(submod_doc, env):
-            list_item.append(node)
+        list_item.extend(_parse_myst(submod_doc, env))
 
     # Return just the list item (caller will add to bullet list)
-    return [list_item]
+    return list_item
+
+@lru_cache(maxsize=4)
+def _read_doc_package(json_path, mtime):
+    """Parse the JSON IR file (cached; mtime is part of the key so edits invalidate it)"""
+    data = Path(json_path).read_bytes()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+@lru_cache(maxsize=8)
+def _resolve_ir_path(srcdir):
+    """Locate api_reference.json under `srcdir/api/` or `srcdir/` (resolved once per srcdir)"""
+    for json_path in (Path(srcdir) / "api" / "api_reference.json",
+                      Path(srcdir) / "api_reference.json"):
+        if json_path.exists():
+            return json_path
+    raise FileNotFoundError(f"api_reference.json not found in {srcdir}/api or {srcdir}")
+
+
+def _ir_version(srcdir):
+    """Return (path, mtime) of the JSON IR, the cache key for everything derived from it"""
+    json_path = _resolve_ir_path(srcdir)
+    return str(json_path), json_path.stat().st_mtime
+
 
-@lru_cache(maxsize=1)
 def _load_doc_package(srcdir):
-    """Load JSON IR from the source directory (cached per build)"""
-    json_path = Path(srcdir) / "api" / "api_reference.json"
-    if not json_path.exists():
-        json_path = Path(srcdir) / "api_reference.json"
-    with open(json_path, encoding="utf-8") as f:
-        return json.load(f)
+    """Load JSON IR from the source directory (parsed once per file version)"""
+    return _read_doc_package(*_ir_version(srcdir))
+
 
+@lru_cache(maxsize=4)
+def _sorted_module_names(json_path, mtime):
+    """All module names of the IR, sorted once per file version"""
+    return tuple(sorted(_read_doc_package(json_path, mtime)['modules']))
 
-def _register_module(env, module_name, doc_module):
+
+def _package_module_names(srcdir, package_name):
+    """Sorted names of `package_name` and its submodules
+
+    Submodule names share the `package_name.` prefix, so they sort into one
+    contiguous run starting at `package_name`; bisect finds it without
+    scanning unrelated modules. The run is bounded by `package_name + '/'`
+    ('/' sorts right after '.'), which may still admit siblings such as
+    `package_name-extra`, hence the final filter.
+    """
+    names = _sorted_module_names(*_ir_version(srcdir))
+    lo = bisect_left(names, package_name)
+    hi = bisect_left(names, package_name + '/', lo)
+    prefix = package_name + '.'
+    return [
+        name for name in names[lo:hi]
+        if name == package_name or name.startswith(prefix)
+    ]
+
+
+@lru_cache(maxsize=4)
+def _index_doc_package(json_path, mtime):
+    """Map module name -> {(kind, name): item}, built in one pass over the IR
+
+    The first item wins on duplicate (kind, name) pairs, like a linear scan.
+    """
+    index = {}
+    for module_name, doc_module in _read_doc_package(json_path, mtime)['modules'].items():
+        items = {}
+        for item in doc_module['items']:
+            items.setdefault((item['kind'], item.get('name')), item)
+        index[module_name] = items
+    return index
+
+
+def _find_item(srcdir, module_name, kind, name):
+    """Look up a module item by kind and name, or None (the module must exist)"""
+    return _index_doc_package(*_ir_version(srcdir))[module_name].get((kind, name))
+
+
+def _register_module(env, module_name, doc_module, py_domain):
     """Register a module with Python domain for py-modindex"""
-    if hasattr(env, 'domaindata'):
-        py_domain = env.get_domain('py')
-        synopsis = _extract_first_line_doc(doc_module.get('doc', ''))
-        py_domain.note_module(
-            module_name,
-            env.docname,
-            synopsis,
-            '',
-            False
-        )
+    synopsis = _extract_first_line_doc(doc_module.get('doc', ''))
+    py_domain.note_module(
+        module_name,
+        env.docname,
+        synopsis,
+        '',
+        False
+    )
+
+
+# Item builders keyed by ItemKind (submodules are rendered separately); each
+# builder yields its index node followed by its desc node
+_ITEM_BUILDERS = {
+    'Function': _build_function,
+    'Class': _build_class,
+    'TypeAlias': _build_type_alias,
+    'Variable': _build_variable,
+}
+
+
+# (ItemKind, section-id suffix, title) in rendering order; kinds without an
+# item builder (Submodules) are rendered as one bullet list
+_SECTION_SPECS = (
+    ('Module', 'submodules', 'Submodules'),
+    ('Function', 'functions', 'Functions'),
+    ('Class', 'classes', 'Classes'),
+    ('TypeAlias', 'type-aliases', 'Type Aliases'),
+    ('Variable', 'variables', 'Variables'),
+)
+
+
+@lru_cache(maxsize=1024)
+def _section_ids(module_name):
+    """Section ids of a module keyed by suffix ('module' for the module section)
+
+    Formatted once per module name. The returned dict is shared; do not mutate.
+    """
+    ids = {'module': f'module-{module_name}', 'contents': f'{module_name}-contents'}
+    for _, suffix, _ in _SECTION_SPECS:
+        ids[suffix] = f'{module_name}-{suffix}'
+    return ids
+
+
+def _build_submodule_section(env, module_name, modules):
+    """Build the Submodules section: a single bullet list for all submodules"""
+    mod_section = nodes.section(ids=[_section_ids(module_name)['submodules']])
+    mod_section += nodes.title(text='Submodules')
+    list_items = [_build_submodule(env, submod, module_name) for submod in modules]
+    mod_section += nodes.bullet_list('', *list_items)
+    return mod_section
+
+
+def _build_item_section(env, section_id, title, items, builder, module_name, register):
+    """Build a titled section holding the nodes produced by `builder` for each item"""
+    section = nodes.section(ids=[section_id])
+    section += nodes.title(text=title)
+    children = []
+    for item in items:
+        children.extend(builder(env, item, module_name, register))
+    section.extend(children)
+    return section
+
+
+def _render_module_sections(env, module_name, buckets, register):
+    """Build the Submodules/Functions/Classes/Type Aliases/Variables sections of a module
+
+    `buckets` is the output of _group_items_by_kind for the module's items.
+    Shared by the single-module and package directives.
+
+    Returns list of section nodes in _SECTION_SPECS order. Empty categories
+    are skipped before any node is constructed.
+    """
+    section_ids = _section_ids(module_name)
+    sections = []
+    for kind, suffix, title in _SECTION_SPECS:
+        items = buckets.get(kind)
+        if not items:
+            continue
+        builder = _ITEM_BUILDERS.get(kind)
+        if builder is None:
+            sections.append(_build_submodule_section(env, module_name, items))
+        else:
+            sections.append(_build_item_section(
+                env, section_ids[suffix], title,
+                items, builder, module_name, register,
+            ))
+    return sections
+
+
+def _build_package_sections(env, doc_package, package_name, module_names, py_domain, register):
+    """Yield one section per module in `module_names` (sorted, package first)
+
+    Registers each module with the Python domain as it is rendered.
+    """
+    doc_modules = doc_package['modules']
+    show_contents_table = doc_package.get('config', {}).get('contents-table', False)
+
+    for module_name in module_names:
+        doc_module = doc_modules[module_name]
+        items = doc_module['items']
+
+        # REGISTER EACH MODULE
+        _register_module(env, module_name, doc_module, py_domain)
+
+        # Add section header for each module
+        section = nodes.section(ids=[_section_ids(module_name)['module']])
+        title_text = f"{module_name} Module" if module_name != package_name else f"{module_name} Package"
+        title = nodes.title(text=title_text)
+        section += title
+
+        # OPTIONALLY: Add module index entry
+        module_index = _create_index_node(module_name, 'module')
+        section += module_index
+
+        # Render module docstring if present
+        if doc_module.get('doc'):
+            section.extend(_parse_myst(doc_module['doc'], env))
+
+        # An empty module (e.g. a re-export shim) keeps its header and
+        # index entry as a link target, but has no tables or subsections
+        if not items:
+            yield section
+            continue
+        buckets = _group_items_by_kind(items)
+
+        # Add module contents table if enabled in config
+        if show_contents_table:
+            section.extend(_build_module_contents_table(env, buckets, module_name))
+
+        # Per-kind subsections (submodules, functions, classes, ...)
+        section.extend(_render_module_sections(env, module_name, buckets, register))
+
+        yield section
 
 
 class Pyo3APIDirective(SphinxDirective):
@@ -1050,11 +1365,14 @@ class Pyo3APIDirective(SphinxDirective):
                 text=f"Module not found: {module_name}"))]
 
         doc_module = doc_package['modules'][module_name]
+        buckets = _group_items_by_kind(doc_module['items'])
+        py_domain = self.env.get_domain('py')
+        register, flush_registrations = _make_registrar(self.env, py_domain)
 
         result = []
 
         # REGISTER MODULE with Python domain for py-modindex
-        _register_module(self.env, module_name, doc_module)
+        _register_module(self.env, module_name, doc_module, py_domain)
 
         # OPTIONALLY: Add module index entry to genindex
         module_index = _create_index_node(module_name, 'module')
@@ -1066,87 +1384,14 @@ class Pyo3APIDirective(SphinxDirective):
 
         # Add module contents table if enabled in config
         if doc_package.get('config', {}).get('contents-table', False):
-            result.extend(_build_module_contents_table(self.env, doc_module, module_name))
-
-        # Group items by kind
-        functions = [item for item in doc_module['items'] if item['kind'] == 'Function']
-        classes = [item for item in doc_module['items'] if item['kind'] == 'Class']
-        type_aliases = [item for item in doc_module['items'] if item['kind'] == 'TypeAlias']
-        variables = [item for item in doc_module['items'] if item['kind'] == 'Variable']
-        modules = [item for item in doc_module['items'] if item['kind'] == 'Module']
+            result.extend(_build_module_contents_table(self.env, buckets, module_name))
 
-        # Submodules section (add FIRST for prominence)
-        if modules:
-            mod_section = nodes.section(ids=[f'{module_name}-submodules'])
-            mod_section += nodes.title(text='Submodules')
-            # Create a single bullet list for all submodules
-            bullet_list = nodes.bullet_list()
-            for submod in modules:
-                bullet_list.extend(self._build_submodule(submod, module_name))
-            mod_section += bullet_list
-            result.append(mod_section)
-
-        # Functions section
-        if functions:
-            func_section = nodes.section(ids=[f'{module_name}-functions'])
-            func_section += nodes.title(text='Functions')
-            for func in functions:
-                func_section.extend(self._build_function(func, module_name))
-            result.append(func_section)
-
-        # Classes section
-        if classes:
-            class_section = nodes.section(ids=[f'{module_name}-classes'])
-            class_section += nodes.title(text='Classes')
-            for cls in classes:
-                class_section.extend(self._build_class(cls, module_name))
-            result.append(class_section)
-
-        # Type Aliases section
-        if type_aliases:
-            alias_section = nodes.section(ids=[f'{module_name}-type-aliases'])
-            alias_section += nodes.title(text='Type Aliases')
-            for alias in type_aliases:
-                alias_section.extend(self._build_type_alias(alias, module_name))
-            result.append(alias_section)
-
-        # Variables section
-        if variables:
-            var_section = nodes.section(ids=[f'{module_name}-variables'])
-            var_section += nodes.title(text='Variables')
-            for var in variables:
-                var_section.extend(self._build_variable(var, module_name))
-            result.append(var_section)
+        # Per-kind sections (submodules, functions, classes, ...)
+        result.extend(_render_module_sections(self.env, module_name, buckets, register))
 
+        flush_registrations()
         return result
 
-    def _build_item(self, item, module_name):
-        kind = item['kind']
-        if kind == 'Function':
-            return self._build_function(item, module_name)
-        elif kind == 'Class':
-            return self._build_class(item, module_name)
-        elif kind == 'TypeAlias':
-            return self._build_type_alias(item, module_name)
-        elif kind == 'Variable':
-            return self._build_variable(item, module_name)
-        return []
-
-    def _build_function(self, func, module_name):
-        return _build_function(self.env, func, module_name)
-
-    def _build_type_alias(self, alias, module_name):
-        return _build_type_alias(self.env, alias, module_name)
-
-    def _build_class(self, cls, module_name):
-        return _build_class(self.env, cls, module_name)
-
-    def _build_variable(self, var, module_name):
-        return _build_variable(self.env, var, module_name)
-
-    def _build_submodule(self, submod, module_name):
-        return _build_submodule(self.env, submod, module_name)
-
 class Pyo3APIPackageDirective(SphinxDirective):
     """Render API for all modules in a package from pyo3-stub-gen JSON IR"""
 
@@ -1154,119 +1399,21 @@ class Pyo3APIPackageDirective(SphinxDirective):
 
     def run(self):
         package_name = self.arguments[0]
+        env = self.env
 
-        doc_package = _load_doc_package(self.env.srcdir)
-
-        # Find all modules matching the package
-        result = []
-        for module_name in sorted(doc_package['modules'].keys()):
-            # Include the package itself and all submodules
-            if module_name == package_name or module_name.startswith(package_name + '.'):
-                doc_module = doc_package['modules'][module_name]
-
-                # REGISTER EACH MODULE
-                _register_module(self.env, module_name, doc_module)
-
-                # Add section header for each module
-                section = nodes.section(ids=[f'module-{module_name}'])
-                title_text = f"{module_name} Module" if module_name != package_name else f"{module_name} Package"
-                title = nodes.title(text=title_text)
-                section += title
-
-                # OPTIONALLY: Add module index entry
-                module_index = _create_index_node(module_name, 'module')
-                section += module_index
-
-                # Render module docstring if present
-                if doc_module.get('doc'):
-                    for node in _parse_myst(doc_module['doc'], self.env):
-                        section.append(node)
-
-                # Add module contents table if enabled in config
-                if doc_package.get('config', {}).get('contents-table', False):
-                    for node in _build_module_contents_table(self.env, doc_module, module_name):
-                        section.append(node)
-
-                # Group items by kind
-                functions = [item for item in doc_module['items'] if item['kind'] == 'Function']
-                classes = [item for item in doc_module['items'] if item['kind'] == 'Class']
-                type_aliases = [item for item in doc_module['items'] if item['kind'] == 'TypeAlias']
-                variables = [item for item in doc_module['items'] if item['kind'] == 'Variable']
-                modules = [item for item in doc_module['items'] if item['kind'] == 'Module']
-
-                # Submodules subsection (add FIRST for prominence)
-                if modules:
-                    mod_section = nodes.section(ids=[f'{module_name}-submodules'])
-                    mod_section += nodes.title(text='Submodules')
-                    # Create a single bullet list for all submodules
-                    bullet_list = nodes.bullet_list()
-                    for submod in modules:
-                        bullet_list.extend(self._build_submodule(submod, module_name))
-                    mod_section += bullet_list
-                    section.append(mod_section)
-
-                # Functions subsection
-                if functions:
-                    func_section = nodes.section(ids=[f'{module_name}-functions'])
-                    func_section += nodes.title(text='Functions')
-                    for func in functions:
-                        func_section.extend(self._build_function(func, module_name))
-                    section.append(func_section)
-
-                # Classes subsection
-                if classes:
-                    class_section = nodes.section(ids=[f'{module_name}-classes'])
-                    class_section += nodes.title(text='Classes')
-                    for cls in classes:
-                        class_section.extend(self._build_class(cls, module_name))
-                    section.append(class_section)
-
-                # Type Aliases subsection
-                if type_aliases:
-                    alias_section = nodes.section(ids=[f'{module_name}-type-aliases'])
-                    alias_section += nodes.title(text='Type Aliases')
-                    for alias in type_aliases:
-                        alias_section.extend(self._build_type_alias(alias, module_name))
-                    section.append(alias_section)
-
-                # Variables subsection
-                if variables:
-                    var_section = nodes.section(ids=[f'{module_name}-variables'])
-                    var_section += nodes.title(text='Variables')
-                    for var in variables:
-                        var_section.extend(self._build_variable(var, module_name))
-                    section.append(var_section)
-
-                result.append(section)
-
-        return result
-
-    def _build_item(self, item, module_name):
-        kind = item['kind']
-        if kind == 'Function':
-            return self._build_function(item, module_name)
-        elif kind == 'Class':
-            return self._build_class(item, module_name)
-        elif kind == 'TypeAlias':
-            return self._build_type_alias(item, module_name)
-        elif kind == 'Variable':
-            return self._build_variable(item, module_name)
-        return []
+        doc_package = _load_doc_package(env.srcdir)
 
-    def _build_function(self, func, module_name):
-        return _build_function(self.env, func, module_name)
-
-    def _build_type_alias(self, alias, module_name):
-        return _build_type_alias(self.env, alias, module_name)
-
-    def _build_class(self, cls, module_name):
-        return _build_class(self.env, cls, module_name)
+        py_domain = env.get_domain('py')
+        register, flush_registrations = _make_registrar(env, py_domain)
 
-    def _build_variable(self, var, module_name):
-        return _build_variable(self.env, var, module_name)
+        # The package itself and all of its submodules
+        module_names = _package_module_names(env.srcdir, package_name)
 
-    def _build_submodule(self, submod, module_name):
-        return _build_submodule(self.env, submod, module_name)
+        result = list(_build_package_sections(
+            env, doc_package, package_name, module_names, py_domain, register
+        ))
+        flush_registrations()
+        return result
 
 class Pyo3APISummaryDirective(SphinxDirective):
     """Render module summary with links to individual item pages.
@@ -1288,11 +1435,12 @@ class Pyo3APISummaryDirective(SphinxDirective):
                 text=f"Module not found: {module_name}"))]
 
         doc_module = doc_package['modules'][module_name]
+        buckets = _group_items_by_kind(doc_module['items'])
 
         result = []
 
         # Register module with Python domain
-        _register_module(self.env, module_name, doc_module)
+        _register_module(self.env, module_name, doc_module, self.env.get_domain('py'))
 
         # Module index entry
         module_index = _create_index_node(module_name, 'module')
@@ -1302,22 +1450,16 @@ class Pyo3APISummaryDirective(SphinxDirective):
         if doc_module.get('doc'):
             result.extend(_parse_myst(doc_module['doc'], self.env))
 
-        # Group items by kind
-        functions = [item for item in doc_module['items'] if item['kind'] == 'Function']
-        classes = [item for item in doc_module['items'] if item['kind'] == 'Class']
-        type_aliases = [item for item in doc_module['items'] if item['kind'] == 'TypeAlias']
-        variables = [item for item in doc_module['items'] if item['kind'] == 'Variable']
-        modules = [item for item in doc_module['items'] if item['kind'] == 'Module']
+        # Items grouped by kind
+        functions = buckets.get('Function', ())
+        classes = buckets.get('Class', ())
+        type_aliases = buckets.get('TypeAlias', ())
+        variables = buckets.get('Variable', ())
+        modules = buckets.get('Module', ())
 
         # Submodules section
         if modules:
-            mod_section = nodes.section(ids=[f'{module_name}-submodules'])
-            mod_section += nodes.title(text='Submodules')
-            bullet_list = nodes.bullet_list()
-            for submod in modules:
-                bullet_list.extend(_build_submodule(self.env, submod, module_name))
-            mod_section += bullet_list
-            result.append(mod_section)
+            result.append(_build_submodule_section(self.env, module_name, modules))
 
         # Summary tables for all item kinds (they each have their own pages)
         # contents-table must be true when separate-items is true (validated at generation time)
@@ -1360,20 +1502,17 @@ class Pyo3APIClassDirective(SphinxDirective):
             return [nodes.error('', nodes.paragraph(
                 text=f"Module not found: {module_name}"))]
 
-        doc_module = doc_package['modules'][module_name]
-
         # Find the class item
-        cls = None
-        for item in doc_module['items']:
-            if item['kind'] == 'Class' and item['name'] == class_name:
-                cls = item
-                break
+        cls = _find_item(self.env.srcdir, module_name, 'Class', class_name)
 
         if cls is None:
             return [nodes.error('', nodes.paragraph(
                 text=f"Class not found: {class_name} in {module_name}"))]
 
-        return _build_class(self.env, cls, module_name)
+        register, flush_registrations = _make_registrar(self.env, self.env.get_domain('py'))
+        result = list(_build_class(self.env, cls, module_name, register))
+        flush_registrations()
+        return result
 
 
 class Pyo3APIFunctionDirective(SphinxDirective):
@@ -1391,20 +1530,17 @@ class Pyo3APIFunctionDirective(SphinxDirective):
             return [nodes.error('', nodes.paragraph(
                 text=f"Module not found: {module_name}"))]
 
-        doc_module = doc_package['modules'][module_name]
-
         # Find the function item
-        func = None
-        for item in doc_module['items']:
-            if item['kind'] == 'Function' and item['name'] == function_name:
-                func = item
-                break
+        func = _find_item(self.env.srcdir, module_name, 'Function', function_name)
 
         if func is None:
             return [nodes.error('', nodes.paragraph(
                 text=f"Function not found: {function_name} in {module_name}"))]
 
-        return _build_function(self.env, func, module_name)
+        register, flush_registrations = _make_registrar(self.env, self.env.get_domain('py'))
+        result = list(_build_function(self.env, func, module_name, register))
+        flush_registrations()
+        return result
 
 
 class Pyo3APITypeAliasDirective(SphinxDirective):
@@ -1422,19 +1558,16 @@ class Pyo3APITypeAliasDirective(SphinxDirective):
             return [nodes.error('', nodes.paragraph(
                 text=f"Module not found: {module_name}"))]
 
-        doc_module = doc_package['modules'][module_name]
-
-        alias = None
-        for item in doc_module['items']:
-            if item['kind'] == 'TypeAlias' and item['name'] == alias_name:
-                alias = item
-                break
+        alias = _find_item(self.env.srcdir, module_name, 'TypeAlias', alias_name)
 
         if alias is None:
             return [nodes.error('', nodes.paragraph(
                 text=f"Type alias not found: {alias_name} in {module_name}"))]
 
-        return _build_type_alias(self.env, alias, module_name)
+        register, flush_registrations = _make_registrar(self.env, self.env.get_domain('py'))
+        result = list(_build_type_alias(self.env, alias, module_name, register))
+        flush_registrations()
+        return result
 
 
 class Pyo3APIVariableDirective(SphinxDirective):
@@ -1452,22 +1585,21 @@ class Pyo3APIVariableDirective(SphinxDirective):
             return [nodes.error('', nodes.paragraph(
                 text=f"Module not found: {module_name}"))]
 
-        doc_module = doc_package['modules'][module_name]
-
-        var = None
-        for item in doc_module['items']:
-            if item['kind'] == 'Variable' and item['name'] == variable_name:
-                var = item
-                break
+        var = _find_item(self.env.srcdir, module_name, 'Variable', variable_name)
 
         if var is None:
             return [nodes.error('', nodes.paragraph(
                 text=f"Variable not found: {variable_name} in {module_name}"))]
 
-        return _build_variable(self.env, var, module_name)
+        register, flush_registrations = _make_registrar(self.env, self.env.get_domain('py'))
+        result = list(_build_variable(self.env, var, module_name, register))
+        flush_registrations()
+        return result
 
 
 def setup(app):
+    # One MyST parser instance reused for every docstring (see _get_myst_parser)
+    app._pyo3_myst_parser = MystParser()
     app.add_directive('pyo3-api', Pyo3APIDirective)
     app.add_directive('pyo3-api-package', Pyo3APIPackageDirective)
     app.add_directive('pyo3-api-summary', Pyo3APISummaryDirective)
@@ -1475,4 +1607,4 @@ def setup(app):
     app.add_directive('pyo3-api-function', Pyo3APIFunctionDirective)
     app.add_directive('pyo3-api-type-alias', Pyo3APITypeAliasDirective)
     app.add_directive('pyo3-api-variable', Pyo3APIVariableDirective)
-    return {'version': '0.1', 'parallel_read_safe': True}
+    return {'version': '0.1', 'parallel_read_safe': True, 'parallel_write_safe': True}